@@ -20,7 +20,6 @@ use std::{
     ffi::CStr,
     fmt::{Debug, Display, Formatter},
     hash::Hash,
-    io::{Cursor, Write},
     str::FromStr,
 };
 
@@ -31,6 +30,9 @@ use uuid::Uuid;
 /// The maximum length of ASCII characters for a `UUID4` string value (includes null terminator).
 pub(crate) const UUID4_LEN: usize = 37;
 
+/// The lowercase hex digits used when encoding a `UUID4` string value.
+const HEX_CHARS: &[u8; 16] = b"0123456789abcdef";
+
 /// Represents a pseudo-random UUID (universally unique identifier)
 /// version 4 based on a 128-bit label as specified in RFC 4122.
 #[repr(C)]
@@ -59,20 +61,18 @@ impl UUID4 {
         bytes[8] = (bytes[8] & 0x3F) | 0x80; // Set the variant to RFC 4122
 
         let mut value = [0u8; UUID4_LEN];
-        let mut cursor = Cursor::new(&mut value[..36]);
-
-        write!(
-            cursor,
-            "{:08x}-{:04x}-{:04x}-{:04x}-{:012x}",
-            u32::from_be_bytes([bytes[0], bytes[1], bytes[2], bytes[3]]),
-            u16::from_be_bytes([bytes[4], bytes[5]]),
-            u16::from_be_bytes([bytes[6], bytes[7]]),
-            u16::from_be_bytes([bytes[8], bytes[9]]),
-            u64::from_be_bytes([
-                bytes[10], bytes[11], bytes[12], bytes[13], bytes[14], bytes[15], 0, 0
-            ]) >> 16
-        )
-        .expect("Failed to write UUID string to buffer");
+        let mut pos = 0;
+
+        // Hex encode directly into the buffer, avoiding the `fmt` machinery on this hot path
+        for (i, byte) in bytes.iter().enumerate() {
+            if matches!(i, 4 | 6 | 8 | 10) {
+                value[pos] = b'-';
+                pos += 1;
+            }
+            value[pos] = HEX_CHARS[(byte >> 4) as usize];
+            value[pos + 1] = HEX_CHARS[(byte & 0x0F) as usize];
+            pos += 2;
+        }
 
         value[36] = 0; // Add the null terminator
 
@@ -189,6 +189,18 @@ mod tests {
         assert_eq!(uuid_parsed.to_string().len(), 36);
     }
 
+    #[rstest]
+    fn test_new_matches_canonical_format() {
+        for _ in 0..100 {
+            let uuid = UUID4::new();
+            let uuid_string = uuid.to_string();
+            let uuid_parsed = Uuid::parse_str(&uuid_string).unwrap();
+            assert_eq!(uuid_parsed.get_variant(), uuid::Variant::RFC4122);
+            assert_eq!(uuid_parsed.hyphenated().to_string(), uuid_string);
+            assert_eq!(uuid.value[36], 0);
+        }
+    }
+
     #[rstest]
     fn test_invalid_uuid() {
         let invalid_uuid = "invalid-uuid-string";
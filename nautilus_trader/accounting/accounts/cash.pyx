@@ -15,6 +15,7 @@
 
 from decimal import Decimal
 
+from nautilus_trader.common.component cimport Logger
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport AccountType
 from nautilus_trader.core.rust.model cimport LiquiditySide
@@ -150,7 +151,9 @@ cdef class CashAccount(Account):
         cdef AccountBalance current_balance = self._balances.get(currency)
         if current_balance is None:
             # TODO: Temporary pending reimplementation of accounting
-            print("Cannot recalculate balance when no current balance")
+            Logger(type(self).__name__).warning(
+                f"Cannot recalculate balance when no current balance for {currency}",
+            )
             return
 
         total_locked = Decimal(0)
@@ -31,6 +31,8 @@ class BinanceSymbol(str):
     Binance compatible symbol.
     """
 
+    __slots__ = ()
+
     def __new__(cls, symbol: str) -> BinanceSymbol:  # noqa: PYI034
         PyCondition.valid_string(symbol, "symbol")
 
@@ -58,6 +60,8 @@ class BinanceSymbols(str):
     Binance compatible list of symbols.
     """
 
+    __slots__ = ()
+
     def __new__(cls, symbols: list[str]) -> BinanceSymbols:  # noqa: PYI034
         PyCondition.not_empty(symbols, "symbols")
 
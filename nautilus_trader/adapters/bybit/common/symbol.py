@@ -53,6 +53,8 @@ class BybitSymbol(str):
     Represents a Bybit specific symbol containing a product type suffix.
     """
 
+    __slots__ = ()
+
     def __new__(cls, symbol: str) -> BybitSymbol:  # noqa: PYI034
         PyCondition.valid_string(symbol, "symbol")
         if not has_valid_bybit_suffix(symbol):
@@ -172,7 +172,7 @@ class BybitDataClient(LiveMarketDataClient):
         )
 
         # Hot caches
-        self._instrument_ids: dict[str, InstrumentId] = {}
+        self._instrument_ids: dict[tuple[str, BybitProductType], InstrumentId] = {}
         self._last_quotes: dict[InstrumentId, QuoteTick] = {}
 
     async def fetch_send_tickers(
@@ -414,8 +414,13 @@ class BybitDataClient(LiveMarketDataClient):
         symbol: str,
         product_type: BybitProductType,
     ) -> InstrumentId:
-        bybit_symbol = BybitSymbol(f"{symbol}-{product_type.value.upper()}")
-        return bybit_symbol.to_instrument_id()
+        key = (symbol, product_type)
+        instrument_id: InstrumentId | None = self._instrument_ids.get(key)
+        if instrument_id is None:
+            bybit_symbol = BybitSymbol(f"{symbol}-{product_type.value.upper()}")
+            instrument_id = bybit_symbol.to_instrument_id()
+            self._instrument_ids[key] = instrument_id
+        return instrument_id
 
     async def _request(
         self,
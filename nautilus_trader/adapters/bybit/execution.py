@@ -252,7 +252,7 @@ class BybitExecutionClient(LiveExecutionClient):
         self._decoder_ws_account_wallet_update = msgspec.json.Decoder(BybitWsAccountWalletMsg)
 
         # Hot caches
-        self._instrument_ids: dict[str, InstrumentId] = {}
+        self._instrument_ids: dict[tuple[str, BybitProductType], InstrumentId] = {}
         self._pending_trailing_stops: dict[ClientOrderId, Order] = {}
 
         self._retry_manager_pool = RetryManagerPool(
@@ -502,8 +502,13 @@ class BybitExecutionClient(LiveExecutionClient):
         symbol: str,
         product_type: BybitProductType,
     ) -> InstrumentId:
-        bybit_symbol = BybitSymbol(f"{symbol}-{product_type.value.upper()}")
-        return bybit_symbol.to_instrument_id()
+        key = (symbol, product_type)
+        instrument_id: InstrumentId | None = self._instrument_ids.get(key)
+        if instrument_id is None:
+            bybit_symbol = BybitSymbol(f"{symbol}-{product_type.value.upper()}")
+            instrument_id = bybit_symbol.to_instrument_id()
+            self._instrument_ids[key] = instrument_id
+        return instrument_id
 
     def _get_cache_active_symbols(self) -> set[str]:
         # Check cache for all active orders
@@ -58,6 +58,8 @@ class OKXSymbol(str):
     Represents an OKX specific symbol containing a instrument type suffix.
     """
 
+    __slots__ = ()
+
     def __new__(cls, symbol: str) -> "OKXSymbol":
         PyCondition.valid_string(symbol, "symbol")
         if not has_valid_okx_suffix(symbol):
@@ -13,7 +13,6 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from abc import abstractmethod
 from decimal import Decimal
 
 import msgspec
@@ -68,7 +67,6 @@ class OKXInstrumentBase(msgspec.Struct):
     maxTriggerSz: str
     maxStopSz: str
 
-    @abstractmethod
     def parse_to_instrument(
         self,
         base_currency: Currency,
@@ -80,7 +78,9 @@ class OKXInstrumentBase(msgspec.Struct):
         ts_event: int,
         ts_init: int,
     ) -> CryptoPerpetual | CurrencyPair | CryptoFuture | OptionsContract:
-        pass
+        raise NotImplementedError(
+            "method `parse_to_instrument` must be implemented in the subclass",
+        )  # pragma: no cover
 
     def _clip_qty(self, value: str) -> float:
         return max(min(float(value), QUANTITY_MAX), QUANTITY_MIN)
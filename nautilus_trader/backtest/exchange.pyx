@@ -15,6 +15,7 @@
 
 from collections import deque
 from decimal import Decimal
+from heapq import heappop
 from heapq import heappush
 
 from nautilus_trader.common.config import InvalidConfiguration
@@ -646,10 +647,9 @@ cdef class SimulatedExchange:
             ts = command.ts_init + self.latency_model.cancel_latency_nanos
         else:
             raise ValueError(f"invalid `TradingCommand`, was {command}")  # pragma: no cover (design-time error)
-        if ts not in self._inflight_counter:
-            self._inflight_counter[ts] = 0
-        self._inflight_counter[ts] += 1
-        cdef (uint64_t, uint64_t) key = (ts, self._inflight_counter[ts])
+        cdef uint64_t counter = self._inflight_counter.get(ts, 0) + 1
+        self._inflight_counter[ts] = counter
+        cdef (uint64_t, uint64_t) key = (ts, counter)
         return key, command
 
     cpdef void process_order_book_delta(self, OrderBookDelta delta):
@@ -861,7 +861,7 @@ cdef class SimulatedExchange:
             ts = self._inflight_queue[0][0][0]
             if ts <= ts_now:
                 # Place message on queue to be processed
-                self._message_queue.appendleft(self._inflight_queue.pop(0)[1])
+                self._message_queue.appendleft(heappop(self._inflight_queue)[1])
                 self._inflight_counter.pop(ts, None)
             else:
                 break
@@ -13,8 +13,6 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import uuid
-
 from cpython.datetime cimport timedelta
 from libc.stdint cimport uint64_t
 
@@ -1389,7 +1387,7 @@ cdef class OrderMatchingEngine:
                     trader_id=position.trader_id,
                     strategy_id=position.strategy_id,
                     instrument_id=position.instrument_id,
-                    client_order_id=ClientOrderId(str(uuid.uuid4())),
+                    client_order_id=ClientOrderId(UUID4().to_str()),
                     order_side=Order.closing_side_c(position.side),
                     quantity=position.quantity,
                     init_id=UUID4(),
@@ -2047,14 +2045,14 @@ cdef class OrderMatchingEngine:
 
         self._position_count += 1
         if self._use_random_ids:
-            return PositionId(str(uuid.uuid4()))
+            return PositionId(UUID4().to_str())
         else:
             return PositionId(f"{self.venue.to_str()}-{self.raw_id}-{self._position_count:03d}")
 
     cdef VenueOrderId _generate_venue_order_id(self):
         self._order_count += 1
         if self._use_random_ids:
-            return VenueOrderId(str(uuid.uuid4()))
+            return VenueOrderId(UUID4().to_str())
         else:
             return VenueOrderId(f"{self.venue.to_str()}-{self.raw_id}-{self._order_count:03d}")
 
@@ -2064,7 +2062,7 @@ cdef class OrderMatchingEngine:
 
     cdef str _generate_trade_id_str(self):
         if self._use_random_ids:
-            return str(uuid.uuid4())
+            return UUID4().to_str()
         else:
             return f"{self.venue.to_str()}-{self.raw_id}-{self._execution_count:03d}"
 
@@ -16,7 +16,6 @@
 import copy
 import pickle
 import time
-import uuid
 from collections import deque
 from decimal import Decimal
 
@@ -41,6 +40,7 @@ from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.core.rust.model cimport PositionSide
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.core.rust.model cimport TriggerType
+from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.execution.messages cimport SubmitOrder
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport BarAggregation
@@ -783,9 +783,7 @@ cdef class Cache(CacheFacade):
         cdef Order order
         for client_order_id, order in self._orders.items():
             # 1: Build _index_venue_orders -> {Venue, {ClientOrderId}}
-            if order.instrument_id.venue not in self._index_venue_orders:
-                self._index_venue_orders[order.instrument_id.venue] = set()
-            self._index_venue_orders[order.instrument_id.venue].add(client_order_id)
+            self._index_venue_orders.setdefault(order.instrument_id.venue, set()).add(client_order_id)
 
             # 2: Build _index_venue_order_ids -> {VenueOrderId, ClientOrderId}
             if order.venue_order_id is not None:
@@ -800,26 +798,18 @@ cdef class Cache(CacheFacade):
             self._index_order_strategy[client_order_id] = order.strategy_id
 
             # 5: Build _index_instrument_orders -> {InstrumentId, {ClientOrderId}}
-            if order.instrument_id not in self._index_instrument_orders:
-                self._index_instrument_orders[order.instrument_id] = set()
-            self._index_instrument_orders[order.instrument_id].add(client_order_id)
+            self._index_instrument_orders.setdefault(order.instrument_id, set()).add(client_order_id)
 
             # 6: Build _index_strategy_orders -> {StrategyId, {ClientOrderId}}
-            if order.strategy_id not in self._index_strategy_orders:
-                self._index_strategy_orders[order.strategy_id] = set()
-            self._index_strategy_orders[order.strategy_id].add(client_order_id)
+            self._index_strategy_orders.setdefault(order.strategy_id, set()).add(client_order_id)
 
             # 7: Build _index_exec_algorithm_orders -> {ExecAlgorithmId, {ClientOrderId}}
             if order.exec_algorithm_id is not None:
-                if order.exec_algorithm_id not in self._index_exec_algorithm_orders:
-                    self._index_exec_algorithm_orders[order.exec_algorithm_id] = set()
-                self._index_exec_algorithm_orders[order.exec_algorithm_id].add(order.client_order_id)
+                self._index_exec_algorithm_orders.setdefault(order.exec_algorithm_id, set()).add(order.client_order_id)
 
             # 8: Build _index_exec_spawn_orders -> {ClientOrderId, {ClientOrderId}}
             if order.exec_algorithm_id is not None:
-                if order.exec_spawn_id not in self._index_exec_spawn_orders:
-                    self._index_exec_spawn_orders[order.exec_spawn_id] = set()
-                self._index_exec_spawn_orders[order.exec_spawn_id].add(order.client_order_id)
+                self._index_exec_spawn_orders.setdefault(order.exec_spawn_id, set()).add(order.client_order_id)
 
             # 9: Build _index_orders -> {ClientOrderId}
             self._index_orders.add(client_order_id)
@@ -853,30 +843,23 @@ cdef class Cache(CacheFacade):
         cdef Position position
         for position_id, position in self._positions.items():
             # 1: Build _index_venue_positions -> {Venue, {PositionId}}
-            if position.instrument_id.venue not in self._index_venue_positions:
-                self._index_venue_positions[position.instrument_id.venue] = set()
-            self._index_venue_positions[position.instrument_id.venue].add(position_id)
+            self._index_venue_positions.setdefault(position.instrument_id.venue, set()).add(position_id)
 
             # 2: Build _index_position_strategy -> {PositionId, StrategyId}
             if position.strategy_id is not None:
                 self._index_position_strategy[position_id] = position.strategy_id
 
             # 3: Build _index_position_orders -> {PositionId, {ClientOrderId}}
-            if position_id not in self._index_position_orders:
-                self._index_position_orders[position_id] = set()
-            index_position_orders = self._index_position_orders[position_id]
+            index_position_orders = self._index_position_orders.setdefault(position_id, set())
             for client_order_id in position.client_order_ids_c():
                 index_position_orders.add(client_order_id)
 
             # 4: Build _index_instrument_positions -> {InstrumentId, {PositionId}}
-            if position.instrument_id not in self._index_instrument_positions:
-                self._index_instrument_positions[position.instrument_id] = set()
-            self._index_instrument_positions[position.instrument_id].add(position_id)
+            self._index_instrument_positions.setdefault(position.instrument_id, set()).add(position_id)
 
             # 5: Build _index_strategy_positions -> {StrategyId, {PositionId}}
-            if position.strategy_id is not None and position.strategy_id not in self._index_strategy_positions:
-                self._index_strategy_positions[position.strategy_id] = set()
-            self._index_strategy_positions[position.strategy_id].add(position.id)
+            if position.strategy_id is not None:
+                self._index_strategy_positions.setdefault(position.strategy_id, set()).add(position.id)
 
             # 6: Build _index_positions -> {PositionId}
             self._index_positions.add(position_id)
@@ -1140,7 +1123,7 @@ cdef class Cache(CacheFacade):
         cdef InstrumentId instrument_id = tick.instrument_id
         ticks = self._quote_ticks.get(instrument_id)
 
-        if not ticks:
+        if ticks is None:
             # The instrument_id was not registered
             ticks = deque(maxlen=self.tick_capacity)
             self._quote_ticks[instrument_id] = ticks
@@ -1162,7 +1145,7 @@ cdef class Cache(CacheFacade):
         cdef InstrumentId instrument_id = tick.instrument_id
         ticks = self._trade_ticks.get(instrument_id)
 
-        if not ticks:
+        if ticks is None:
             # The instrument_id was not registered
             ticks = deque(maxlen=self.tick_capacity)
             self._trade_ticks[instrument_id] = ticks
@@ -1181,20 +1164,21 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(bar, "bar")
 
-        bars = self._bars.get(bar.bar_type)
+        cdef BarType bar_type = bar.bar_type
+        bars = self._bars.get(bar_type)
 
-        if not bars:
+        if bars is None:
             # The bar type was not registered
             bars = deque(maxlen=self.bar_capacity)
-            self._bars[bar.bar_type] = bars
+            self._bars[bar_type] = bars
 
         bars.appendleft(bar)
 
-        cdef PriceType price_type = bar.bar_type.spec.price_type
+        cdef PriceType price_type = bar_type.spec.price_type
         if price_type == PriceType.BID:
-            self._bars_bid[bar.bar_type.instrument_id] = bar
+            self._bars_bid[bar_type.instrument_id] = bar
         elif price_type == PriceType.ASK:
-            self._bars_ask[bar.bar_type.instrument_id] = bar
+            self._bars_ask[bar_type.instrument_id] = bar
 
     cpdef void add_quote_ticks(self, list ticks):
         """
@@ -1219,17 +1203,23 @@ cdef class Cache(CacheFacade):
 
         cached_ticks = self._quote_ticks.get(instrument_id)
 
-        if not cached_ticks:
+        if cached_ticks is None:
             # The instrument_id was not registered
             cached_ticks = deque(maxlen=self.tick_capacity)
             self._quote_ticks[instrument_id] = cached_ticks
 
+        # Hoist the latest cached timestamp out of the loop
+        cdef bint has_last = len(cached_ticks) > 0
+        cdef uint64_t ts_last = cached_ticks[0].ts_event if has_last else 0
+
         cdef QuoteTick tick
         for tick in ticks:
-            if cached_ticks and tick.ts_event <= cached_ticks[0].ts_event:
+            if has_last and tick._mem.ts_event <= ts_last:
                 # Only add more recent data to cache
                 continue
             cached_ticks.appendleft(tick)
+            ts_last = tick._mem.ts_event
+            has_last = True
 
     cpdef void add_trade_ticks(self, list ticks):
         """
@@ -1254,16 +1244,22 @@ cdef class Cache(CacheFacade):
 
         cached_ticks = self._trade_ticks.get(instrument_id)
 
-        if not cached_ticks:
+        if cached_ticks is None:
             cached_ticks = deque(maxlen=self.tick_capacity)
             self._trade_ticks[instrument_id] = cached_ticks
 
+        # Hoist the latest cached timestamp out of the loop
+        cdef bint has_last = len(cached_ticks) > 0
+        cdef uint64_t ts_last = cached_ticks[0].ts_event if has_last else 0
+
         cdef TradeTick tick
         for tick in ticks:
-            if cached_ticks and tick.ts_event <= cached_ticks[0].ts_event:
+            if has_last and tick._mem.ts_event <= ts_last:
                 # Only add more recent data to cache
                 continue
             cached_ticks.appendleft(tick)
+            ts_last = tick._mem.ts_event
+            has_last = True
 
     cpdef void add_bars(self, list bars):
         """
@@ -1288,16 +1284,22 @@ cdef class Cache(CacheFacade):
 
         cached_bars = self._bars.get(bar_type)
 
-        if not cached_bars:
+        if cached_bars is None:
             cached_bars = deque(maxlen=self.bar_capacity)
             self._bars[bar_type] = cached_bars
 
+        # Hoist the latest cached timestamp out of the loop
+        cdef bint has_last = len(cached_bars) > 0
+        cdef uint64_t ts_last = cached_bars[0].ts_event if has_last else 0
+
         cdef Bar bar
         for bar in bars:
-            if cached_bars and bar.ts_event <= cached_bars[0].ts_event:
+            if has_last and bar._mem.ts_event <= ts_last:
                 # Only add more recent data to cache
                 continue
             cached_bars.appendleft(bar)
+            ts_last = bar._mem.ts_event
+            has_last = True
 
         bar = bars[-1]
         cdef PriceType price_type = bar.bar_type.spec.price_type
@@ -1523,7 +1525,7 @@ cdef class Cache(CacheFacade):
             if not exec_spawn_orders:
                 self._index_exec_spawn_orders[order.exec_spawn_id] = {order.client_order_id}
             else:
-                self._index_exec_spawn_orders[order.exec_spawn_id].add(order.client_order_id)
+                exec_spawn_orders.add(order.client_order_id)
 
         # Update emulation
         if order.emulation_trigger == TriggerType.NO_TRIGGER:
@@ -1705,7 +1707,7 @@ cdef class Cache(CacheFacade):
 
         # Reassign position ID
         cdef Position copied_position = copy.deepcopy(position)
-        copied_position.id = PositionId(f"{position.id.to_str()}-{uuid.uuid4()}")
+        copied_position.id = PositionId(f"{position.id.to_str()}-{UUID4().to_str()}")
         cdef bytes position_pickled = pickle.dumps(copied_position)
 
         if snapshots is not None:
@@ -60,6 +60,7 @@ cdef class Actor(Component):
     cdef dict[InstrumentId, list[Indicator]] _indicators_for_quotes
     cdef dict[InstrumentId, list[Indicator]] _indicators_for_trades
     cdef dict[BarType, list[Indicator]] _indicators_for_bars
+    cdef dict[BarType, object] _bar_handlers
 
     cdef readonly PortfolioFacade portfolio
     """The read-only portfolio for the actor.\n\n:returns: `PortfolioFacade`"""
@@ -116,6 +117,7 @@ cdef class Actor(Component):
     cpdef void register_indicator_for_quote_ticks(self, InstrumentId instrument_id, Indicator indicator)
     cpdef void register_indicator_for_trade_ticks(self, InstrumentId instrument_id, Indicator indicator)
     cpdef void register_indicator_for_bars(self, BarType bar_type, Indicator indicator)
+    cpdef void register_bar_handler(self, BarType bar_type, handler)
 
 # -- ACTOR COMMANDS -------------------------------------------------------------------------------
 
@@ -289,9 +291,9 @@ cdef class Actor(Component):
     cpdef void _handle_bars_response(self, DataResponse response)
     cpdef void _handle_aggregated_bars_response(self, DataResponse response)
     cpdef void _finish_response(self, UUID4 request_id)
-    cpdef void _handle_indicators_for_quote(self, list indicators, QuoteTick tick)
-    cpdef void _handle_indicators_for_trade(self, list indicators, TradeTick tick)
-    cpdef void _handle_indicators_for_bar(self, list indicators, Bar bar)
+    cdef void _handle_indicators_for_quote(self, list indicators, QuoteTick tick)
+    cdef void _handle_indicators_for_trade(self, list indicators, TradeTick tick)
+    cdef void _handle_indicators_for_bar(self, list indicators, Bar bar)
 
 # -- EGRESS ---------------------------------------------------------------------------------------
 
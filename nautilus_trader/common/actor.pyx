@@ -129,6 +129,9 @@ cdef class Actor(Component):
         self._indicators_for_trades: dict[InstrumentId, list[Indicator]] = {}
         self._indicators_for_bars: dict[BarType, list[Indicator]] = {}
 
+        # Bar handlers
+        self._bar_handlers: dict[BarType, Callable[[Bar], None]] = {}
+
         # Configuration
         self.config = config
 
@@ -657,11 +660,9 @@ cdef class Actor(Component):
         if indicator not in self._indicators:
             self._indicators.append(indicator)
 
-        if instrument_id not in self._indicators_for_quotes:
-            self._indicators_for_quotes[instrument_id] = []  # type: list[Indicator]
-
-        if indicator not in self._indicators_for_quotes[instrument_id]:
-            self._indicators_for_quotes[instrument_id].append(indicator)
+        cdef list indicators = self._indicators_for_quotes.setdefault(instrument_id, [])
+        if indicator not in indicators:
+            indicators.append(indicator)
             self.log.info(f"Registered Indicator {indicator} for {instrument_id} quotes")
         else:
             self.log.error(f"Indicator {indicator} already registered for {instrument_id} quotes")
@@ -685,11 +686,9 @@ cdef class Actor(Component):
         if indicator not in self._indicators:
             self._indicators.append(indicator)
 
-        if instrument_id not in self._indicators_for_trades:
-            self._indicators_for_trades[instrument_id] = []  # type: list[Indicator]
-
-        if indicator not in self._indicators_for_trades[instrument_id]:
-            self._indicators_for_trades[instrument_id].append(indicator)
+        cdef list indicators = self._indicators_for_trades.setdefault(instrument_id, [])
+        if indicator not in indicators:
+            indicators.append(indicator)
             self.log.info(f"Registered Indicator {indicator} for {instrument_id} trades")
         else:
             self.log.error(f"Indicator {indicator} already registered for {instrument_id} trades")
@@ -715,15 +714,42 @@ cdef class Actor(Component):
 
         cdef BarType standard_bar_type = bar_type.standard()
 
-        if standard_bar_type not in self._indicators_for_bars:
-            self._indicators_for_bars[standard_bar_type] = []  # type: list[Indicator]
-
-        if indicator not in self._indicators_for_bars[standard_bar_type]:
-            self._indicators_for_bars[standard_bar_type].append(indicator)
+        cdef list indicators = self._indicators_for_bars.setdefault(standard_bar_type, [])
+        if indicator not in indicators:
+            indicators.append(indicator)
             self.log.info(f"Registered Indicator {indicator} for {standard_bar_type} bars")
         else:
             self.log.error(f"Indicator {indicator} already registered for {standard_bar_type} bars")
 
+    cpdef void register_bar_handler(self, BarType bar_type, handler):
+        """
+        Register the given handler to receive bars for the given bar type in
+        place of `on_bar`.
+
+        Strategies which branch on `bar.bar_type` within `on_bar` can instead
+        register one handler per bar type. Bars for bar types without a
+        registered handler continue to be passed to `on_bar`.
+
+        Parameters
+        ----------
+        bar_type : BarType
+            The bar type for the handler.
+        handler : Callable[[Bar], None]
+            The handler for the bars.
+
+        Raises
+        ------
+        TypeError
+            If `handler` is not of type `Callable`.
+
+        """
+        Condition.not_none(bar_type, "bar_type")
+        Condition.callable(handler, "handler")
+
+        cdef BarType standard_bar_type = bar_type.standard()
+        self._bar_handlers[standard_bar_type] = handler
+        self.log.info(f"Registered handler {handler} for {standard_bar_type} bars")
+
 # -- ACTOR COMMANDS -------------------------------------------------------------------------------
 
     cpdef dict[str, bytes] save(self):
@@ -1087,6 +1113,7 @@ cdef class Actor(Component):
         self._indicators_for_quotes.clear()
         self._indicators_for_trades.clear()
         self._indicators_for_bars.clear()
+        self._bar_handlers.clear()
 
     cpdef void _dispose(self):
         self.on_dispose()
@@ -2829,7 +2856,7 @@ cdef class Actor(Component):
         System method (not intended to be called by user code).
 
         """
-        Condition.not_none(deltas, "deltas")
+        assert deltas is not None  # Design-time error
 
         if OrderBookDeltas in self._pyo3_conversion_types:
             deltas = deltas.to_pyo3()
@@ -2857,7 +2884,7 @@ cdef class Actor(Component):
         System method (not intended to be called by user code).
 
         """
-        Condition.not_none(order_book, "order_book")
+        assert order_book is not None  # Design-time error
 
         if self._fsm.state == ComponentState.RUNNING:
             try:
@@ -2882,7 +2909,7 @@ cdef class Actor(Component):
         System method (not intended to be called by user code).
 
         """
-        Condition.not_none(tick, "tick")
+        assert tick is not None  # Design-time error
 
         # Update indicators
         cdef list indicators = self._indicators_for_quotes.get(tick.instrument_id)
@@ -2952,7 +2979,7 @@ cdef class Actor(Component):
         System method (not intended to be called by user code).
 
         """
-        Condition.not_none(tick, "tick")
+        assert tick is not None  # Design-time error
 
         # Update indicators
         cdef list indicators = self._indicators_for_trades.get(tick.instrument_id)
@@ -3010,7 +3037,9 @@ cdef class Actor(Component):
         """
         Handle the given bar data.
 
-        If state is ``RUNNING`` then passes to `on_bar`.
+        If state is ``RUNNING`` then passes to the handler registered for the
+        bar type (see `register_bar_handler`). Bars for bar types without a
+        registered handler are passed to `on_bar`.
 
         Parameters
         ----------
@@ -3022,16 +3051,25 @@ cdef class Actor(Component):
         System method (not intended to be called by user code).
 
         """
-        Condition.not_none(bar, "bar")
+        assert bar is not None  # Design-time error
+
+        # Each access to `bar.bar_type` creates a new instance, so take one key
+        # and reuse its cached hash for any lookups
+        cdef BarType bar_type = bar.bar_type
 
         # Update indicators
-        cdef list indicators = self._indicators_for_bars.get(bar.bar_type)
+        cdef list indicators = self._indicators_for_bars.get(bar_type)
         if indicators:
             self._handle_indicators_for_bar(indicators, bar)
 
+        cdef object handler
         if self._fsm.state == ComponentState.RUNNING:
             try:
-                self.on_bar(bar)
+                handler = self._bar_handlers.get(bar_type)
+                if handler is not None:
+                    handler(bar)
+                else:
+                    self.on_bar(bar)
             except Exception as e:
                 self.log.exception(f"Error on handling {repr(bar)}", e)
                 raise
@@ -3272,17 +3310,17 @@ cdef class Actor(Component):
         if callback is not None:
             callback(request_id)
 
-    cpdef void _handle_indicators_for_quote(self, list indicators, QuoteTick tick):
+    cdef void _handle_indicators_for_quote(self, list indicators, QuoteTick tick):
         cdef Indicator indicator
         for indicator in indicators:
             indicator.handle_quote_tick(tick)
 
-    cpdef void _handle_indicators_for_trade(self, list indicators, TradeTick tick):
+    cdef void _handle_indicators_for_trade(self, list indicators, TradeTick tick):
         cdef Indicator indicator
         for indicator in indicators:
             indicator.handle_trade_tick(tick)
 
-    cpdef void _handle_indicators_for_bar(self, list indicators, Bar bar):
+    cdef void _handle_indicators_for_bar(self, list indicators, Bar bar):
         cdef Indicator indicator
         for indicator in indicators:
             indicator.handle_bar(bar)
@@ -3327,11 +3365,13 @@ cdef class Actor(Component):
             return GreeksData.from_bytes(self.cache.get(greeks_key(instrument_id)))
 
         # Future case
-        if instrument_id not in self._future_greeks:
+        future_greeks = self._future_greeks.get(instrument_id)
+        if future_greeks is None:
             future_definition = self.cache.instrument(instrument_id)
-            self._future_greeks[instrument_id] = GreeksData.from_delta(instrument_id, int(future_definition.multiplier))
+            future_greeks = GreeksData.from_delta(instrument_id, int(future_definition.multiplier))
+            self._future_greeks[instrument_id] = future_greeks
 
-        return self._future_greeks[instrument_id]
+        return future_greeks
 
     def portfolio_greeks(self, str underlying = "", Venue venue = None, InstrumentId instrument_id = None,
                          StrategyId strategy_id = None,
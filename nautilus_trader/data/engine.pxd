@@ -69,6 +69,8 @@ cdef class DataEngine(Component):
     cdef readonly dict[str, SnapshotInfo] _snapshot_info
     cdef readonly dict[UUID4, int] _query_group_n_components
     cdef readonly dict[UUID4, list] _query_group_components
+    cdef dict[InstrumentId, str] _topic_cache_quotes
+    cdef dict[InstrumentId, str] _topic_cache_trades
 
     cdef readonly bint _time_bars_build_with_no_updates
     cdef readonly bint _time_bars_timestamp_on_close
@@ -204,6 +206,8 @@ cdef class DataEngine(Component):
     cpdef void _update_synthetic_with_quote(self, SyntheticInstrument synthetic, QuoteTick update)
     cpdef void _update_synthetics_with_trade(self, list synthetics, TradeTick update)
     cpdef void _update_synthetic_with_trade(self, SyntheticInstrument synthetic, TradeTick update)
+    cdef str _get_quotes_topic(self, InstrumentId instrument_id)
+    cdef str _get_trades_topic(self, InstrumentId instrument_id)
 
 
 cdef class SnapshotInfo:
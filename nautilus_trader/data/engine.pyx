@@ -144,6 +144,8 @@ cdef class DataEngine(Component):
         self._snapshot_info: dict[str, SnapshotInfo] = {}
         self._query_group_n_components: dict[UUID4, int] = {}
         self._query_group_components: dict[UUID4, list] = {}
+        self._topic_cache_quotes: dict[InstrumentId, str] = {}
+        self._topic_cache_trades: dict[InstrumentId, str] = {}
 
         # Settings
         self.debug = config.debug
@@ -546,6 +548,8 @@ cdef class DataEngine(Component):
         self._subscribed_synthetic_trades.clear()
         self._buffered_deltas_map.clear()
         self._snapshot_info.clear()
+        self._topic_cache_quotes.clear()
+        self._topic_cache_trades.clear()
 
         self._clock.cancel_timers()
         self.command_count = 0
@@ -1274,9 +1278,7 @@ cdef class DataEngine(Component):
         Condition.not_none(instrument_id, "instrument_id")
 
         if not self._msgbus.has_subscribers(
-            f"data.quotes"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            self._get_quotes_topic(instrument_id),
         ):
             if instrument_id in client.subscribed_quote_ticks():
                 client.unsubscribe_quote_ticks(instrument_id, params)
@@ -1291,9 +1293,7 @@ cdef class DataEngine(Component):
         Condition.not_none(instrument_id, "instrument_id")
 
         if not self._msgbus.has_subscribers(
-            f"data.trades"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            self._get_trades_topic(instrument_id),
         ):
             if instrument_id in client.subscribed_trade_ticks():
                 client.unsubscribe_trade_ticks(instrument_id, params)
@@ -1870,30 +1870,30 @@ cdef class DataEngine(Component):
     cpdef void _handle_quote_tick(self, QuoteTick tick):
         self._cache.add_quote_tick(tick)
 
+        cdef InstrumentId instrument_id = tick.instrument_id
+
         # Handle synthetics update
-        cdef list synthetics = self._synthetic_quote_feeds.get(tick.instrument_id)
+        cdef list synthetics = self._synthetic_quote_feeds.get(instrument_id)
         if synthetics is not None:
             self._update_synthetics_with_quote(synthetics, tick)
 
         self._msgbus.publish_c(
-            topic=f"data.quotes"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=self._get_quotes_topic(instrument_id),
             msg=tick,
         )
 
     cpdef void _handle_trade_tick(self, TradeTick tick):
         self._cache.add_trade_tick(tick)
 
+        cdef InstrumentId instrument_id = tick.instrument_id
+
         # Handle synthetics update
-        cdef list synthetics = self._synthetic_trade_feeds.get(tick.instrument_id)
+        cdef list synthetics = self._synthetic_trade_feeds.get(instrument_id)
         if synthetics is not None:
             self._update_synthetics_with_trade(synthetics, tick)
 
         self._msgbus.publish_c(
-            topic=f"data.trades"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=self._get_trades_topic(instrument_id),
             msg=tick,
         )
 
@@ -2204,6 +2204,20 @@ cdef class DataEngine(Component):
 
 # -- INTERNAL -------------------------------------------------------------------------------------
 
+    cdef str _get_quotes_topic(self, InstrumentId instrument_id):
+        cdef str topic = self._topic_cache_quotes.get(instrument_id)
+        if topic is None:
+            topic = f"data.quotes.{instrument_id.venue}.{instrument_id.symbol}"
+            self._topic_cache_quotes[instrument_id] = topic
+        return topic
+
+    cdef str _get_trades_topic(self, InstrumentId instrument_id):
+        cdef str topic = self._topic_cache_trades.get(instrument_id)
+        if topic is None:
+            topic = f"data.trades.{instrument_id.venue}.{instrument_id.symbol}"
+            self._topic_cache_trades[instrument_id] = topic
+        return topic
+
     # Python wrapper to enable callbacks
     cpdef void _internal_update_instruments(self, list instruments: [Instrument]):
         # Handle all instruments individually
@@ -2325,18 +2339,14 @@ cdef class DataEngine(Component):
             self._handle_subscribe_bars(client, composite_bar_type, False, params)
         elif bar_type.spec.price_type == PriceType.LAST:
             self._msgbus.subscribe(
-                topic=f"data.trades"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=self._get_trades_topic(bar_type.instrument_id),
                 handler=aggregator.handle_trade_tick,
                 priority=5,
             )
             self._handle_subscribe_trade_ticks(client, bar_type.instrument_id, params)
         else:
             self._msgbus.subscribe(
-                topic=f"data.quotes"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=self._get_quotes_topic(bar_type.instrument_id),
                 handler=aggregator.handle_quote_tick,
                 priority=5,
             )
@@ -2365,17 +2375,13 @@ cdef class DataEngine(Component):
             self._handle_unsubscribe_bars(client, composite_bar_type, params)
         elif bar_type.spec.price_type == PriceType.LAST:
             self._msgbus.unsubscribe(
-                topic=f"data.trades"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=self._get_trades_topic(bar_type.instrument_id),
                 handler=aggregator.handle_trade_tick,
             )
             self._handle_unsubscribe_trade_ticks(client, bar_type.instrument_id, params)
         else:
             self._msgbus.unsubscribe(
-                topic=f"data.quotes"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=self._get_quotes_topic(bar_type.instrument_id),
                 handler=aggregator.handle_quote_tick,
             )
             self._handle_unsubscribe_quote_ticks(client, bar_type.instrument_id, params)
@@ -2433,9 +2439,7 @@ cdef class DataEngine(Component):
         )
 
         self._msgbus.publish_c(
-            topic=f"data.quotes"
-                  f".{synthetic_instrument_id.venue}"
-                  f".{synthetic_instrument_id.symbol}",
+            topic=self._get_quotes_topic(synthetic_instrument_id),
             msg=synthetic_quote,
         )
 
@@ -2482,8 +2486,6 @@ cdef class DataEngine(Component):
         )
 
         self._msgbus.publish_c(
-            topic=f"data.trades"
-                  f".{synthetic_instrument_id.venue}"
-                  f".{synthetic_instrument_id.symbol}",
+            topic=self._get_trades_topic(synthetic_instrument_id),
             msg=synthetic_trade,
         )
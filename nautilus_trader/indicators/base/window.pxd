@@ -0,0 +1,31 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+cimport numpy as np
+
+
+cdef class RollingWindow:
+    cdef np.ndarray _array
+    cdef double[::1] _buffer
+    cdef int _index
+
+    cdef readonly int capacity
+    """The maximum number of values in the window.\n\n:returns: `int`"""
+    cdef readonly int count
+    """The current number of values in the window.\n\n:returns: `int`"""
+
+    cpdef void append(self, double value)
+    cpdef np.ndarray values(self)
+    cpdef void clear(self)
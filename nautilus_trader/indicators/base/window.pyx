@@ -0,0 +1,98 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import cython
+import numpy as np
+
+cimport numpy as np
+
+from nautilus_trader.core.correctness cimport Condition
+
+
+cdef class RollingWindow:
+    """
+    Provides a fixed capacity window over the most recently appended values.
+
+    Values are held in a mirrored ring buffer, with each value written at two
+    positions `capacity` apart, so the current window is always a contiguous
+    slice of the underlying array and is never copied.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of values in the window.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(self, int capacity):
+        Condition.positive_int(capacity, "capacity")
+
+        self._array = np.zeros(2 * capacity, dtype=np.float64)
+        self._buffer = self._array
+        self._index = 0
+
+        self.capacity = capacity
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef void append(self, double value):
+        """
+        Append the given value, dropping the oldest value if at capacity.
+
+        Parameters
+        ----------
+        value : double
+            The value to append.
+
+        """
+        self._buffer[self._index] = value
+        self._buffer[self._index + self.capacity] = value
+
+        self._index += 1
+        if self._index == self.capacity:
+            self._index = 0
+
+        if self.count < self.capacity:
+            self.count += 1
+
+    cpdef np.ndarray values(self):
+        """
+        Return a view of the values in the window, from oldest to newest.
+
+        Returns
+        -------
+        np.ndarray[float64]
+
+        """
+        if self.count < self.capacity:
+            return self._array[:self.count]
+        return self._array[self._index:self._index + self.capacity]
+
+    cpdef void clear(self):
+        """
+        Clear all values from the window.
+        """
+        self._buffer[:] = 0.0
+        self._index = 0
+        self.count = 0
@@ -13,16 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
-import numpy as np
-
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.stats cimport fast_mad_with_mean
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingWindow
 from nautilus_trader.model.data cimport Bar
 
 
@@ -62,7 +59,7 @@ cdef class CommodityChannelIndex(Indicator):
 
         self.period = period
         self.scalar = scalar
-        self._prices = deque(maxlen=period)
+        self._prices = RollingWindow(period)
         self._ma = MovingAverageFactory.create(period, MovingAverageType.SIMPLE)
         self._mad = 0.0
         self.value = 0.0
@@ -108,7 +105,7 @@ cdef class CommodityChannelIndex(Indicator):
         self._prices.append(typical_price)
         self._ma.update_raw(typical_price)
         self._mad = fast_mad_with_mean(
-            values=np.asarray(self._prices, dtype=np.float64),
+            values=self._prices.values(),
             mean=self._ma.value,
         )
         if self._ma.initialized:
@@ -14,11 +14,10 @@
 # -------------------------------------------------------------------------------------------------
 
 from collections import deque
-from statistics import mean
 
-import numpy as np
-
-cimport numpy as np
+from libc.math cimport INFINITY
+from libc.math cimport M_PI
+from libc.math cimport atan
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
@@ -87,25 +86,48 @@ cdef class LinearRegression(Indicator):
             else:
                 return
 
-        cdef np.ndarray x_arr = np.arange(1, self.period + 1, dtype=np.float64)
-        cdef np.ndarray y_arr = np.asarray(self._inputs, dtype=np.float64)
-        cdef double x_sum = 0.5 * self.period * (self.period + 1)
-        cdef double x2_sum = x_sum * (2 * self.period + 1) / 3
-        cdef double divisor = self.period * x2_sum - x_sum * x_sum
-        cdef double y_sum = sum(y_arr)
-        cdef double xy_sum = sum(x_arr * y_arr)
-        self.slope = (self.period * xy_sum - x_sum * y_sum) / divisor
+        cdef int period = self.period
+        cdef double x_sum = 0.5 * period * (period + 1)
+        cdef double x2_sum = x_sum * (2 * period + 1) / 3
+        cdef double divisor = period * x2_sum - x_sum * x_sum
+        cdef double y_first = self._inputs[0]
+        cdef double y_sum = 0.0
+        cdef double xy_sum = 0.0
+        cdef double y
+        cdef bint is_constant = True
+        cdef int i = 0
+        for y in self._inputs:
+            i += 1
+            y_sum += y
+            xy_sum += i * y
+            if y != y_first:
+                is_constant = False
+        self.slope = (period * xy_sum - x_sum * y_sum) / divisor
         self.intercept = (y_sum * x2_sum - x_sum * xy_sum) / divisor
 
-        cdef np.ndarray residuals = np.zeros(self.period, dtype=np.float64)
-        cdef int i
-        for i in np.arange(self.period):
-            residuals[i] = self.slope * x_arr[i] + self.intercept - y_arr[i]
-
-        self.value = residuals[-1] + y_arr[-1]
-        self.degree = 180.0 / np.pi * np.arctan(self.slope)
-        self.cfo = 100.0 * residuals[-1] / y_arr[-1]
-        self.R2 = 1.0 - sum(residuals * residuals) / sum((y_arr - mean(y_arr)) * (y_arr - mean(y_arr)))
+        cdef double y_mean = y_sum / period
+        cdef double residual = 0.0
+        cdef double residuals_sum_sq = 0.0
+        cdef double deviations_sum_sq = 0.0
+        i = 0
+        for y in self._inputs:
+            i += 1
+            residual = self.slope * i + self.intercept - y
+            residuals_sum_sq += residual * residual
+            deviations_sum_sq += (y - y_mean) * (y - y_mean)
+
+        # `residual` now holds the value for the most recent input
+        self.value = residual + close
+        self.degree = 180.0 / M_PI * atan(self.slope)
+        self.cfo = 100.0 * residual / close
+
+        if is_constant:
+            # A constant window has zero variance, so R2 is undefined. Rounding in
+            # `y_mean` and the fit leaves noise in both sums, so define it as -inf
+            # rather than let that noise decide between -inf, NaN or a finite value
+            self.R2 = -INFINITY
+        else:
+            self.R2 = 1.0 - residuals_sum_sq / deviations_sum_sq
 
     cpdef void _reset(self):
         self._inputs.clear()
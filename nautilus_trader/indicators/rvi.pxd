@@ -15,6 +15,7 @@
 
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingWindow
 from nautilus_trader.model.data cimport Bar
 
 
@@ -22,7 +23,7 @@ cdef class RelativeVolatilityIndex(Indicator):
     cdef MovingAverage _ma
     cdef MovingAverage _pos_ma
     cdef MovingAverage _neg_ma
-    cdef object _prices
+    cdef RollingWindow _prices
 
     cdef readonly int period
     """The window period.\n\n:returns: `int`"""
@@ -13,8 +13,6 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
 import numpy as np
 
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
@@ -23,6 +21,7 @@ from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.stats cimport fast_std_with_mean
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingWindow
 from nautilus_trader.model.data cimport Bar
 
 
@@ -59,7 +58,7 @@ cdef class RelativeVolatilityIndex(Indicator):
 
         self.period = period
         self.scalar = scalar
-        self._prices = deque(maxlen=period)
+        self._prices = RollingWindow(period)
         self._ma = MovingAverageFactory.create(period, MovingAverageType.SIMPLE)
         self._pos_ma = MovingAverageFactory.create(period, ma_type)
         self._neg_ma = MovingAverageFactory.create(period, ma_type)
@@ -95,7 +94,7 @@ cdef class RelativeVolatilityIndex(Indicator):
         self._ma.update_raw(close)
 
         self._std = fast_std_with_mean(
-            values=np.asarray(self._prices, dtype=np.float64),
+            values=self._prices.values(),
             mean=self._ma.value,
         )
 
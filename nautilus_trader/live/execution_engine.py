@@ -15,7 +15,6 @@
 
 import asyncio
 import math
-import uuid
 from asyncio import Queue
 from collections import Counter
 from decimal import Decimal
@@ -931,7 +930,7 @@ class LiveExecutionEngine(ExecutionEngine):
             diff_report = OrderStatusReport(
                 instrument_id=report.instrument_id,
                 account_id=report.account_id,
-                venue_order_id=VenueOrderId(str(uuid.uuid4())),
+                venue_order_id=VenueOrderId(UUID4().value),
                 order_side=order_side,
                 order_type=OrderType.MARKET,
                 time_in_force=TimeInForce.DAY,
@@ -132,6 +132,7 @@ cdef class BarSpecification:
 
 cdef class BarType:
     cdef BarType_t _mem
+    cdef object _hash
 
     cdef str to_str(self)
 
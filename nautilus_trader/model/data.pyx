@@ -718,6 +718,8 @@ cdef class BarType:
                 state[7],
             )
 
+        self._hash = None
+
     cdef str to_str(self):
         return cstr_to_pystr(bar_type_to_cstr(&self._mem))
 
@@ -737,7 +739,9 @@ cdef class BarType:
         return self.to_str() >= other.to_str()
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        if self._hash is None:
+            self._hash = hash(self.to_str())  # Cache hash for improved time complexity
+        return self._hash
 
     def __str__(self) -> str:
         return self.to_str()
@@ -55,6 +55,7 @@ cdef class Venue(Identifier):
 
 cdef class InstrumentId(Identifier):
     cdef InstrumentId_t _mem
+    cdef object _hash
 
     @staticmethod
     cdef InstrumentId from_mem_c(InstrumentId_t mem)
@@ -334,6 +334,7 @@ cdef class InstrumentId(Identifier):
         self._mem = instrument_id_from_cstr(
             pystr_to_cstr(state),
         )
+        self._hash = None
 
     def __eq__(self, InstrumentId other) -> bool:
         if other is None:
@@ -341,7 +342,9 @@ cdef class InstrumentId(Identifier):
         return strcmp(self._mem.symbol._0, other._mem.symbol._0) == 0 and strcmp(self._mem.venue._0, other._mem.venue._0) == 0
 
     def __hash__(self) -> int:
-        return hash(self.to_str())
+        if self._hash is None:
+            self._hash = hash(self.to_str())  # Cache hash for improved time complexity
+        return self._hash
 
     @staticmethod
     cdef InstrumentId from_mem_c(InstrumentId_t mem):
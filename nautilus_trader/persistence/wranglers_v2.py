@@ -13,7 +13,6 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import abc
 from typing import Any, ClassVar
 
 import pandas as pd
@@ -23,7 +22,7 @@ from nautilus_trader.core import nautilus_pyo3
 from nautilus_trader.model.instruments import Instrument
 
 
-class WranglerBase(abc.ABC):
+class WranglerBase:
     IGNORE_KEYS: ClassVar[set[bytes]] = {b"class", b"pandas"}
 
     @classmethod
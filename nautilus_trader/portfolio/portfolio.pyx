@@ -1136,11 +1136,17 @@ cdef class Portfolio(PortfolioFacade):
 
         cdef double total_pnl = 0.0
 
+        # Last prices and exchange rates only vary by side for a single instrument,
+        # so calculate each at most once rather than per position
         cdef:
             Position position
             Price last
+            Price last_long = None
+            Price last_short = None
             double pnl
             double xrate
+            double xrate_buy = 0.0
+            double xrate_sell = 0.0
         for position in positions_open:
             if position.instrument_id != instrument_id:
                 continue  # Nothing to calculate
@@ -1148,22 +1154,34 @@ cdef class Portfolio(PortfolioFacade):
             if position.side == PositionSide.FLAT:
                 continue  # Nothing to calculate
 
-            last = self._get_last_price(position)
+            last = last_long if position.side == PositionSide.LONG else last_short
             if last is None:
-                self._log.debug(
-                    f"Cannot calculate unrealized PnL: no prices for {instrument_id}"
-                )
-                self._pending_calcs.add(instrument.id)
-                return None  # Cannot calculate
+                last = self._get_last_price(position)
+                if last is None:
+                    self._log.debug(
+                        f"Cannot calculate unrealized PnL: no prices for {instrument_id}"
+                    )
+                    self._pending_calcs.add(instrument.id)
+                    return None  # Cannot calculate
+                if position.side == PositionSide.LONG:
+                    last_long = last
+                else:
+                    last_short = last
 
             pnl = position.unrealized_pnl(last).as_f64_c()
 
             if account.base_currency is not None:
-                xrate = self._calculate_xrate_to_base(
-                    instrument=instrument,
-                    account=account,
-                    side=position.entry,
-                )
+                xrate = xrate_buy if position.entry == OrderSide.BUY else xrate_sell
+                if xrate == 0.0:
+                    xrate = self._calculate_xrate_to_base(
+                        instrument=instrument,
+                        account=account,
+                        side=position.entry,
+                    )
+                    if position.entry == OrderSide.BUY:
+                        xrate_buy = xrate
+                    else:
+                        xrate_sell = xrate
 
                 if xrate == 0.0:
                     self._log.debug(
@@ -1216,6 +1234,8 @@ cdef class Portfolio(PortfolioFacade):
             Price last
             double pnl
             double xrate
+            double xrate_buy = 0.0
+            double xrate_sell = 0.0
         for position in positions:
             if position.instrument_id != instrument_id:
                 continue  # Nothing to calculate
@@ -1226,11 +1246,17 @@ cdef class Portfolio(PortfolioFacade):
             pnl = position.realized_pnl.as_f64_c()
 
             if account.base_currency is not None:
-                xrate = self._calculate_xrate_to_base(
-                    instrument=instrument,
-                    account=account,
-                    side=position.entry,
-                )
+                xrate = xrate_buy if position.entry == OrderSide.BUY else xrate_sell
+                if xrate == 0.0:
+                    xrate = self._calculate_xrate_to_base(
+                        instrument=instrument,
+                        account=account,
+                        side=position.entry,
+                    )
+                    if position.entry == OrderSide.BUY:
+                        xrate_buy = xrate
+                    else:
+                        xrate_sell = xrate
 
                 if xrate == 0.0:
                     self._log.debug(
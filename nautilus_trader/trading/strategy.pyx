@@ -41,6 +41,7 @@ from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport LogColor
 from nautilus_trader.common.component cimport MessageBus
 from nautilus_trader.common.component cimport TimeEvent
+from nautilus_trader.common.component cimport is_logging_initialized
 from nautilus_trader.common.factories cimport OrderFactory
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.fsm cimport InvalidStateTrigger
@@ -1527,10 +1528,11 @@ cdef class Strategy(Actor):
         """
         Condition.not_none(event, "event")
 
-        if type(event) in self._warning_events:
-            self.log.warning(f"{RECV}{EVT} {event}")
-        else:
-            self.log.info(f"{RECV}{EVT} {event}")
+        if is_logging_initialized():
+            if type(event) in self._warning_events:
+                self.log.warning(f"{RECV}{EVT} {event}")
+            else:
+                self.log.info(f"{RECV}{EVT} {event}")
 
         cdef Order order
         if self.manage_gtd_expiry and isinstance(event, OrderEvent):
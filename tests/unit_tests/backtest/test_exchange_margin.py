@@ -2986,6 +2986,41 @@ class TestSimulatedExchangeMarginAccount:
         assert entry.status == OrderStatus.ACCEPTED
         assert entry.quantity == 200_000
 
+    def test_latency_model_processes_inflight_commands_in_timestamp_order(self) -> None:
+        # Arrange
+        self.exchange.set_latency_model(LatencyModel(secs_to_nanos(1)))
+        entry1 = self.strategy.order_factory.limit(
+            instrument_id=_USDJPY_SIM.id,
+            order_side=OrderSide.BUY,
+            price=_USDJPY_SIM.make_price(100),
+            quantity=_USDJPY_SIM.make_qty(100_000),
+        )
+        entry2 = self.strategy.order_factory.limit(
+            instrument_id=_USDJPY_SIM.id,
+            order_side=OrderSide.BUY,
+            price=_USDJPY_SIM.make_price(100),
+            quantity=_USDJPY_SIM.make_qty(100_000),
+        )
+        entry3 = self.strategy.order_factory.limit(
+            instrument_id=_USDJPY_SIM.id,
+            order_side=OrderSide.BUY,
+            price=_USDJPY_SIM.make_price(100),
+            quantity=_USDJPY_SIM.make_qty(100_000),
+        )
+
+        # Act: arrive at 1s, 3s then 2s
+        self.strategy.submit_order(entry1)
+        self.clock.set_time(secs_to_nanos(2))
+        self.strategy.submit_order(entry2)
+        self.clock.set_time(secs_to_nanos(1))
+        self.strategy.submit_order(entry3)
+        self.exchange.process(secs_to_nanos(2))
+
+        # Assert
+        assert entry1.status == OrderStatus.ACCEPTED
+        assert entry2.status == OrderStatus.SUBMITTED
+        assert entry3.status == OrderStatus.ACCEPTED
+
 
 class TestSimulatedExchangeL1:
     def setup(self) -> None:
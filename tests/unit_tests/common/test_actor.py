@@ -1143,6 +1143,32 @@ class TestActor:
         assert actor.calls == ["on_start", "on_trade_tick"]
         assert actor.store == [tick]
 
+    @pytest.mark.parametrize(
+        "handler_name",
+        [
+            "handle_order_book_deltas",
+            "handle_order_book",
+            "handle_quote_tick",
+            "handle_trade_tick",
+            "handle_bar",
+        ],
+    )
+    def test_data_handlers_when_passed_none_raise_assertion_error(self, handler_name: str) -> None:
+        # Arrange
+        actor = MockActor()
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        actor.start()
+
+        # Act, Assert
+        with pytest.raises(AssertionError):
+            getattr(actor, handler_name)(None)
+
     def test_handle_bar_when_not_running_does_not_send_to_on_bar(self) -> None:
         # Arrange
         actor = MockActor()
@@ -1183,6 +1209,78 @@ class TestActor:
         assert actor.calls == ["on_start", "on_bar"]
         assert actor.store[0] == bar
 
+    def test_handle_bar_when_handler_registered_sends_to_handler_not_on_bar(self) -> None:
+        # Arrange
+        actor = MockActor()
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        bar = TestDataStubs.bar_5decimal()
+        handler: list[Bar] = []
+        actor.register_bar_handler(bar.bar_type, handler.append)
+        actor.start()
+
+        # Act
+        actor.handle_bar(bar)
+
+        # Assert
+        assert actor.calls == ["on_start"]
+        assert handler == [bar]
+
+    def test_handle_bar_when_handler_registered_for_other_bar_type_sends_to_on_bar(self) -> None:
+        # Arrange
+        actor = MockActor()
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        handler: list[Bar] = []
+        actor.register_bar_handler(TestDataStubs.bartype_audusd_5min_bid(), handler.append)
+        actor.start()
+
+        bar = TestDataStubs.bar_5decimal()
+
+        # Act
+        actor.handle_bar(bar)
+
+        # Assert
+        assert actor.calls == ["on_start", "on_bar"]
+        assert actor.store == [bar]
+        assert handler == []
+
+    def test_handle_bar_after_reset_sends_to_on_bar(self) -> None:
+        # Arrange
+        actor = MockActor()
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        bar = TestDataStubs.bar_5decimal()
+        handler: list[Bar] = []
+        actor.register_bar_handler(bar.bar_type, handler.append)
+        actor.start()
+        actor.stop()
+        actor.reset()
+        actor.start()
+
+        # Act
+        actor.handle_bar(bar)
+
+        # Assert
+        assert actor.calls == ["on_start", "on_stop", "on_reset", "on_start", "on_bar"]
+        assert actor.store == [bar]
+        assert handler == []
+
     def test_handle_bars(self) -> None:
         # Arrange
         actor = MockActor()
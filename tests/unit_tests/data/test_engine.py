@@ -40,6 +40,7 @@ from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AggregationSource
 from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.enums import BarAggregation
 from nautilus_trader.model.enums import BookType
@@ -1423,6 +1424,73 @@ class TestDataEngine:
         # Assert
         assert handler == [tick]
 
+    @pytest.mark.parametrize(
+        ("data_cls", "topic", "tick"),
+        [
+            [
+                QuoteTick,
+                "data.quotes.BINANCE.ETHUSDT",
+                TestDataStubs.quote_tick(instrument=ETHUSDT_BINANCE),
+            ],
+            [
+                TradeTick,
+                "data.trades.BINANCE.ETHUSDT",
+                TestDataStubs.trade_tick(instrument=ETHUSDT_BINANCE),
+            ],
+        ],
+    )
+    def test_subscribe_process_unsubscribe_ticks_round_trip_uses_same_topic(
+        self,
+        data_cls: type,
+        topic: str,
+        tick: Data,
+    ):
+        # Arrange
+        self.data_engine.register_client(self.binance_client)
+        self.binance_client.start()
+
+        handler = []
+        self.msgbus.subscribe(topic=topic, handler=handler.append)
+
+        data_type = DataType(data_cls, metadata={"instrument_id": ETHUSDT_BINANCE.id})
+        subscribe = Subscribe(
+            client_id=ClientId(BINANCE.value),
+            venue=BINANCE,
+            data_type=data_type,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        self.data_engine.execute(subscribe)
+
+        def unsubscribe():
+            self.data_engine.execute(
+                Unsubscribe(
+                    client_id=ClientId(BINANCE.value),
+                    venue=BINANCE,
+                    data_type=data_type,
+                    command_id=UUID4(),
+                    ts_init=self.clock.timestamp_ns(),
+                ),
+            )
+
+        def client_subscriptions():
+            if data_cls is QuoteTick:
+                return self.binance_client.subscribed_quote_ticks()
+            return self.binance_client.subscribed_trade_ticks()
+
+        # Act
+        self.data_engine.process(tick)
+        unsubscribe()  # Topic still has a subscriber
+        subscribed_while_handler_registered = client_subscriptions()
+        self.msgbus.unsubscribe(topic=topic, handler=handler.append)
+        unsubscribe()
+
+        # Assert
+        assert handler == [tick]
+        assert subscribed_while_handler_registered == [ETHUSDT_BINANCE.id]
+        assert client_subscriptions() == []
+
     def test_process_quote_tick_when_subscribers_then_sends_to_registered_handlers(
         self,
     ):
@@ -1824,6 +1892,70 @@ class TestDataEngine:
         assert self.data_engine.subscribed_bars() == []
         assert self.binance_client.subscribed_bars() == []
 
+    @pytest.mark.parametrize(
+        ("price_type", "tick_topic", "tick"),
+        [
+            [
+                PriceType.LAST,
+                "data.trades.BINANCE.ETHUSDT",
+                TestDataStubs.trade_tick(instrument=ETHUSDT_BINANCE),
+            ],
+            [
+                PriceType.BID,
+                "data.quotes.BINANCE.ETHUSDT",
+                TestDataStubs.quote_tick(instrument=ETHUSDT_BINANCE),
+            ],
+        ],
+    )
+    def test_subscribe_then_unsubscribe_internal_bar_type_removes_aggregator_tick_handler(
+        self,
+        price_type: PriceType,
+        tick_topic: str,
+        tick: Data,
+    ):
+        # Arrange
+        self.data_engine.register_client(self.binance_client)
+        self.binance_client.start()
+
+        bar_spec = BarSpecification(1, BarAggregation.TICK, price_type)
+        bar_type = BarType(ETHUSDT_BINANCE.id, bar_spec, AggregationSource.INTERNAL)
+
+        handler = []
+        self.msgbus.subscribe(topic=f"data.bars.{bar_type}", handler=handler.append)
+
+        data_type = DataType(Bar, metadata={"bar_type": bar_type})
+        subscribe = Subscribe(
+            client_id=ClientId(BINANCE.value),
+            venue=BINANCE,
+            data_type=data_type,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        self.data_engine.execute(subscribe)
+        self.data_engine.process(tick)
+
+        assert self.msgbus.has_subscribers(tick_topic)
+        assert len(handler) == 1
+
+        self.msgbus.unsubscribe(topic=f"data.bars.{bar_type}", handler=handler.append)
+        unsubscribe = Unsubscribe(
+            client_id=ClientId(BINANCE.value),
+            venue=BINANCE,
+            data_type=data_type,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        # Act
+        self.data_engine.execute(unsubscribe)
+
+        # Assert
+        assert not self.msgbus.has_subscribers(tick_topic)
+        assert self.binance_client.subscribed_quote_ticks() == []
+        assert self.binance_client.subscribed_trade_ticks() == []
+        assert self.data_engine.subscribed_bars() == []
+
     def test_process_bar_when_subscriber_then_sends_to_registered_handler(self):
         # Arrange
         self.data_engine.register_client(self.binance_client)
@@ -126,6 +126,22 @@ class TestBollingerBands:
         assert indicator.middle == 1.0001900000000001
         assert indicator.lower == 1.0000644493609618
 
+    def test_value_after_window_rolls_over_uses_latest_period_inputs(self):
+        # Arrange
+        indicator1 = BollingerBands(3, 2.0)
+        indicator2 = BollingerBands(3, 2.0)
+
+        # Act
+        for price in (5.0, 4.0, 3.0, 1.0, 2.0):
+            indicator1.update_raw(price, price, price)
+        for price in (3.0, 1.0, 2.0):
+            indicator2.update_raw(price, price, price)
+
+        # Assert
+        assert indicator1.upper == indicator2.upper
+        assert indicator1.middle == indicator2.middle == 2.0
+        assert indicator1.lower == indicator2.lower
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         indicator = BollingerBands(5, 2.0)
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import numpy as np
+import pytest
 
 from nautilus_trader.indicators.cci import CommodityChannelIndex
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
@@ -72,6 +73,21 @@ class TestCommodityChannelIndex:
         assert self.cci._mad == 0.008899733333333352
         assert self.cci.value == 27.284213259823147
 
+    def test_value_after_window_rolls_over_uses_latest_period_inputs(self):
+        # Arrange
+        indicator1 = CommodityChannelIndex(period=3)
+        indicator2 = CommodityChannelIndex(period=3)
+
+        # Act
+        for price in (9.0, 8.0, 7.0, 1.0, 2.0, 6.0):
+            indicator1.update_raw(price, price, price)
+        for price in (1.0, 2.0, 6.0):
+            indicator2.update_raw(price, price, price)
+
+        # Assert
+        assert indicator1._mad == indicator2._mad == 2.0
+        assert indicator1.value == indicator2.value == pytest.approx(100.0)
+
     def test_reset(self):
         self.cci.update_raw(0.18000, 0.01001, 0.13810)
 
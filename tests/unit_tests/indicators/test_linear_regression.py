@@ -85,6 +85,26 @@ class TestLinearRegression:
         assert self.linear_regression.cfo == 0
         assert self.linear_regression.R2 == 1
 
+    @pytest.mark.parametrize(
+        ("period", "value"),
+        [
+            [4, 1.00003],
+            [9, 1.1],
+            [14, 0.3],
+            [20, 1.0],
+        ],
+    )
+    def test_r2_with_constant_inputs_is_negative_infinity(self, period: int, value: float):
+        # Arrange
+        linear_regression = LinearRegression(period=period)
+
+        # Act
+        for _ in range(period * 3):
+            linear_regression.update_raw(value)
+
+        # Assert
+        assert linear_regression.R2 == -math.inf
+
     def test_reset(self):
         self.linear_regression.update_raw(1.00000)
 
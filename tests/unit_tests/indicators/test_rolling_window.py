@@ -0,0 +1,73 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.indicators.base.window import RollingWindow
+
+
+class TestRollingWindow:
+    def test_init_with_invalid_capacity_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            RollingWindow(0)
+
+    def test_values_when_empty_returns_empty_array(self):
+        # Arrange
+        window = RollingWindow(3)
+
+        # Act, Assert
+        assert window.capacity == 3
+        assert window.count == 0
+        assert len(window) == 0
+        assert list(window.values()) == []
+
+    def test_values_before_capacity_returns_values_in_order(self):
+        # Arrange
+        window = RollingWindow(3)
+
+        # Act
+        window.append(1.0)
+        window.append(2.0)
+
+        # Assert
+        assert window.count == 2
+        assert list(window.values()) == [1.0, 2.0]
+
+    def test_values_after_rolling_over_returns_latest_values_in_order(self):
+        # Arrange
+        window = RollingWindow(3)
+
+        # Act
+        for value in (1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0):
+            window.append(value)
+
+        # Assert
+        assert window.count == 3
+        assert list(window.values()) == [5.0, 6.0, 7.0]
+
+    def test_clear_resets_window(self):
+        # Arrange
+        window = RollingWindow(3)
+        for value in (1.0, 2.0, 3.0, 4.0):
+            window.append(value)
+
+        # Act
+        window.clear()
+        window.append(9.0)
+
+        # Assert
+        assert window.count == 1
+        assert list(window.values()) == [9.0]
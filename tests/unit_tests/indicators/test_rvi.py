@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 from nautilus_trader.indicators.rvi import RelativeVolatilityIndex
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
@@ -97,6 +98,21 @@ class TestRelativeVolatilityIndex:
         # Assert
         assert self.rvi.value == 67.2446018137445
 
+    def test_value_after_window_rolls_over_uses_latest_period_inputs(self):
+        # Arrange
+        indicator1 = RelativeVolatilityIndex(3, ma_type=MovingAverageType.SIMPLE)
+        indicator2 = RelativeVolatilityIndex(3, ma_type=MovingAverageType.SIMPLE)
+
+        # Act
+        for price in (9.0, 1.0, 7.0, 1.0, 3.0, 2.0, 5.0, 4.0, 6.0):
+            indicator1.update_raw(price)
+        for price in (2.0, 8.0, 3.0, 1.0, 3.0, 2.0, 5.0, 4.0, 6.0):
+            indicator2.update_raw(price)
+
+        # Assert
+        assert indicator1.initialized
+        assert indicator1.value == indicator2.value
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         self.rvi.update_raw(1.00020)
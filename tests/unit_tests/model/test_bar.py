@@ -299,6 +299,27 @@ class TestBarType:
         # Assert
         assert unpickled == bar_type
 
+    def test_bar_type_hash_equal_across_instances_and_pickling(self):
+        # Arrange
+        instrument_id = InstrumentId(Symbol("AUD/USD"), Venue("SIM"))
+        bar_spec = BarSpecification(1, BarAggregation.MINUTE, PriceType.BID)
+        bar_type = BarType(instrument_id, bar_spec)
+        bar_types = {bar_type: 1}  # Hashes (and caches) before pickling
+
+        # Act
+        unpickled = pickle.loads(pickle.dumps(bar_type))  # noqa: S301 (pickle is safe here)
+        from_str = BarType.from_str("AUD/USD.SIM-1-MINUTE-BID-EXTERNAL")
+        from_bar = TestDataStubs.bar_5decimal().bar_type
+
+        # Assert
+        assert hash(bar_type) == hash(str(bar_type))
+        for other in (unpickled, from_str, from_bar):
+            assert other == bar_type
+            assert other is not bar_type
+            assert hash(other) == hash(bar_type)
+            assert bar_types[other] == 1
+        assert GBPUSD_1_MIN_BID not in bar_types
+
     def test_bar_type_hash_str_and_repr(self):
         # Arrange
         instrument_id = InstrumentId(Symbol("AUD/USD"), Venue("SIM"))
@@ -232,6 +232,24 @@ def test_instrument_id_pickling() -> None:
     assert unpickled == instrument_id
 
 
+def test_instrument_id_hash_equal_across_instances_and_pickling() -> None:
+    # Arrange
+    instrument_id1 = InstrumentId(Symbol("AUD/USD"), Venue("SIM"))
+    cache = {instrument_id1: 1}  # Hashes (and caches) before pickling
+
+    # Act
+    instrument_id2 = InstrumentId.from_str("AUD/USD.SIM")
+    unpickled = pickle.loads(pickle.dumps(instrument_id1))  # noqa: S301 (pickle is safe here)
+
+    # Assert
+    assert hash(instrument_id1) == hash("AUD/USD.SIM")
+    assert hash(instrument_id2) == hash(instrument_id1)
+    assert hash(unpickled) == hash(instrument_id1)
+    assert cache[instrument_id2] == 1
+    assert cache[unpickled] == 1
+    assert InstrumentId.from_str("GBP/USD.SIM") not in cache
+
+
 def test_instrument_id_repr() -> None:
     # Arrange
     instrument_id = InstrumentId(Symbol("AUD/USD"), Venue("SIM"))
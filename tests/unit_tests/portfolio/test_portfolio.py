@@ -101,10 +101,6 @@ class TestPortfolio:
         self.cache.add_instrument(BTCUSD_BITMEX)
         self.cache.add_instrument(ETHUSD_BITMEX)
 
-    def test_account_when_no_account_returns_none(self):
-        # Arrange, Act, Assert
-        assert self.portfolio.account(SIM) is None
-
     def test_account_when_account_returns_the_account_facade(self):
         # Arrange
         state = AccountState(
@@ -135,61 +131,43 @@ class TestPortfolio:
         assert result.id.get_issuer() == "BINANCE"
         assert result.id.get_id() == "1513111"
 
-    def test_balances_locked_when_no_account_for_venue_returns_none(self):
-        # Arrange, Act, Assert
-        assert self.portfolio.balances_locked(SIM) is None
-
-    def test_margins_init_when_no_account_for_venue_returns_none(self):
-        # Arrange, Act, Assert
-        assert self.portfolio.margins_init(SIM) is None
-
-    def test_margins_maint_when_no_account_for_venue_returns_none(self):
-        # Arrange, Act, Assert
-        assert self.portfolio.margins_maint(SIM) is None
-
-    def test_unrealized_pnl_for_instrument_when_no_instrument_returns_none(self):
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ["account", (SIM,)],
+            ["balances_locked", (SIM,)],
+            ["margins_init", (SIM,)],
+            ["margins_maint", (SIM,)],
+            ["unrealized_pnl", (USDJPY_SIM.id,)],
+            ["realized_pnl", (USDJPY_SIM.id,)],
+            ["net_exposures", (SIM,)],
+        ],
+    )
+    def test_query_when_no_account_or_instrument_returns_none(self, method: str, args: tuple):
         # Arrange, Act, Assert
-        assert self.portfolio.unrealized_pnl(USDJPY_SIM.id) is None
+        assert getattr(self.portfolio, method)(*args) is None
 
-    def test_unrealized_pnl_for_venue_when_no_account_returns_empty_dict(self):
+    @pytest.mark.parametrize("method", ["unrealized_pnls", "realized_pnls"])
+    def test_pnls_for_venue_when_no_account_returns_empty_dict(self, method: str):
         # Arrange, Act, Assert
-        assert self.portfolio.unrealized_pnls(SIM) == {}
-
-    def test_realized_pnl_for_instrument_when_no_instrument_returns_none(self):
-        # Arrange, Act, Assert
-        assert self.portfolio.realized_pnl(USDJPY_SIM.id) is None
-
-    def test_realized_pnl_for_venue_when_no_account_returns_empty_dict(self):
-        # Arrange, Act, Assert
-        assert self.portfolio.realized_pnls(SIM) == {}
+        assert getattr(self.portfolio, method)(SIM) == {}
 
     def test_net_position_when_no_positions_returns_zero(self):
         # Arrange, Act, Assert
         assert self.portfolio.net_position(AUDUSD_SIM.id) == Decimal(0)
 
-    def test_net_exposures_when_no_positions_returns_none(self):
-        # Arrange, Act, Assert
-        assert self.portfolio.net_exposures(SIM) is None
-
-    def test_is_net_long_when_no_positions_returns_false(self):
+    @pytest.mark.parametrize(
+        ("method", "args", "expected"),
+        [
+            ["is_net_long", (AUDUSD_SIM.id,), False],
+            ["is_net_short", (AUDUSD_SIM.id,), False],
+            ["is_flat", (AUDUSD_SIM.id,), True],
+            ["is_completely_flat", (), True],
+        ],
+    )
+    def test_position_state_when_no_positions(self, method: str, args: tuple, expected: bool):
         # Arrange, Act, Assert
-        assert self.portfolio.is_net_long(AUDUSD_SIM.id) is False
-
-    def test_is_net_short_when_no_positions_returns_false(self):
-        # Arrange, Act, Assert
-        assert self.portfolio.is_net_short(AUDUSD_SIM.id) is False
-
-    def test_is_flat_when_no_positions_returns_true(self):
-        # Arrange, Act, Assert
-        assert self.portfolio.is_flat(AUDUSD_SIM.id) is True
-
-    def test_is_completely_flat_when_no_positions_returns_true(self):
-        # Arrange, Act, Assert
-        assert self.portfolio.is_flat(AUDUSD_SIM.id) is True
-
-    def test_open_value_when_no_account_returns_none(self):
-        # Arrange, Act, Assert
-        assert self.portfolio.net_exposures(SIM) is None
+        assert getattr(self.portfolio, method)(*args) is expected
 
     def test_update_tick(self):
         # Arrange
@@ -1119,6 +1097,151 @@ class TestPortfolio:
         assert not self.portfolio.is_flat(AUDUSD_SIM.id)
         assert not self.portfolio.is_completely_flat()
 
+    def test_opening_hedged_positions_on_both_sides_updates_portfolio(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        fills = [
+            (OrderSide.BUY, "0.80000"),
+            (OrderSide.BUY, "0.81000"),
+            (OrderSide.SELL, "0.82000"),
+            (OrderSide.SELL, "0.79000"),
+        ]
+        for i, (side, px) in enumerate(fills):
+            order = self.order_factory.market(
+                AUDUSD_SIM.id,
+                side,
+                Quantity.from_int(100_000),
+            )
+            self.cache.add_order(order, position_id=None)
+
+            fill = TestEventStubs.order_filled(
+                order,
+                instrument=AUDUSD_SIM,
+                strategy_id=StrategyId("S-1"),
+                account_id=account_id,
+                position_id=PositionId(f"P-{i + 1}"),
+                last_px=Price.from_str(px),
+            )
+            self.cache.update_order(order)
+
+            position = Position(instrument=AUDUSD_SIM, fill=fill)
+            self.cache.add_position(position, OmsType.HEDGING)
+            self.portfolio.update_position(TestEventStubs.position_opened(position))
+
+        # No prices yet, so the unrealized PnL cannot be calculated
+        assert self.portfolio.unrealized_pnl(AUDUSD_SIM.id) is None
+
+        last_audusd = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.80501"),
+            ask_price=Price.from_str("0.80505"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        # Act
+        self.cache.add_quote_tick(last_audusd)
+        self.portfolio.update_quote_tick(last_audusd)
+
+        # Assert
+        # Longs are marked at the bid: 501 - 499, shorts at the ask: 1495 - 1505
+        assert self.portfolio.unrealized_pnl(AUDUSD_SIM.id) == Money(-8.00, USD)
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(-8.00, USD)}
+        # Commissions only: 1.60 + 1.62 + 1.64 + 1.58
+        assert self.portfolio.realized_pnl(AUDUSD_SIM.id) == Money(-6.44, USD)
+        assert self.portfolio.realized_pnls(SIM) == {USD: Money(-6.44, USD)}
+        assert self.portfolio.net_position(AUDUSD_SIM.id) == Decimal(0)
+        assert self.portfolio.is_flat(AUDUSD_SIM.id)
+
+    def test_unrealized_pnl_for_hedged_positions_when_insufficient_data_for_xrate_returns_none(
+        self,
+    ):
+        # Arrange
+        AccountFactory.register_calculated_account("BITMEX")
+
+        account_id = AccountId("BITMEX-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=BTC,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(10.00000000, BTC),
+                    Money(0.00000000, BTC),
+                    Money(10.00000000, BTC),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        for i, side in enumerate((OrderSide.BUY, OrderSide.SELL, OrderSide.BUY)):
+            order = self.order_factory.market(
+                ETHUSD_BITMEX.id,
+                side,
+                Quantity.from_int(100),
+            )
+            fill = TestEventStubs.order_filled(
+                order=order,
+                instrument=ETHUSD_BITMEX,
+                strategy_id=StrategyId("S-1"),
+                account_id=account_id,
+                position_id=PositionId(f"P-{i + 1}"),
+                last_px=Price.from_str("376.05"),
+            )
+            position = Position(instrument=ETHUSD_BITMEX, fill=fill)
+            self.cache.add_position(position, OmsType.HEDGING)
+            self.portfolio.update_position(TestEventStubs.position_opened(position))
+
+        last_ethusd = QuoteTick(
+            instrument_id=ETHUSD_BITMEX.id,
+            bid_price=Price.from_str("376.05"),
+            ask_price=Price.from_str("377.10"),
+            bid_size=Quantity.from_str("16"),
+            ask_size=Quantity.from_str("25"),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        # Act
+        self.cache.add_quote_tick(last_ethusd)
+        self.portfolio.update_quote_tick(last_ethusd)
+
+        # Assert
+        assert self.portfolio.unrealized_pnl(ETHUSD_BITMEX.id) is None
+        assert self.portfolio.unrealized_pnls(BITMEX) == {}
+
     def test_modifying_position_updates_portfolio(self):
         # Arrange
         AccountFactory.register_calculated_account("SIM")